@@ -1,7 +1,25 @@
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
 import tkinter as tk
+import bisect
 import json
+import os
+from functools import cached_property
+
+try:
+    import orjson
+
+    def _dumps(data):
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    def _loads(raw):
+        return orjson.loads(raw)
+except ImportError:  # orjson is optional; fall back to the stdlib
+    def _dumps(data):
+        return json.dumps(data, indent=4).encode()
+
+    def _loads(raw):
+        return json.loads(raw)
 from frames.all_users_frame import AllUsersFrame
 from frames.welcome_frame import WelcomeFrame
 from frames.info_frame import InfoFrame
@@ -44,10 +62,20 @@ class App:
         self.canvas = None
         self.selected_user = None
         self.user_data_file = "user_info.json"
+        self.settings_file = "app_settings.json"
+        settings = self._load_settings()
+        self.low_threshold = settings.get("low_threshold")
+        self.high_threshold = settings.get("high_threshold")
         self.users_info = self.load_user_data()
+        self._name_index = sorted(self.users_info)
+        self._save_after_id = None
+        self._pending_user_data = None
+        self._last_written_hash = None
         ctk.set_appearance_mode("light")
         ctk.set_default_color_theme("blue")
 
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
         self.welcome_frame = WelcomeFrame(self)
         self.info_frame = InfoFrame(self)
         self.main_frame = MainFrame(self)
@@ -55,6 +83,12 @@ class App:
 
         self.show_frame(self.welcome_frame)
 
+    @cached_property
+    def graph_generator(self):
+        """Creates the shared GraphGenerator on first use."""
+        from graph_generator import GraphGenerator
+        return GraphGenerator(self)
+
     def show_frame(self, frame):
         """
         Raises the specified frame to the top of the window stack.
@@ -96,14 +130,51 @@ class App:
             dict: The user data. If a username is provided, returns the data for that user.
         """
         try:
-            with open(self.user_data_file, "r") as file:
-                data = json.load(file)
+            with open(self.user_data_file, "rb") as file:
+                data = _loads(file.read())
                 if username:
                     return data.get(username, {})
                 return data
-        except (FileNotFoundError, json.JSONDecodeError):
+        except (FileNotFoundError, ValueError):
             return {} if not username else None
 
+    def _load_settings(self):
+        """Loads persisted app settings, tolerating a missing or corrupt file."""
+        try:
+            with open(self.settings_file, "rb") as file:
+                return _loads(file.read())
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def save_settings(self):
+        """Persists the glucose thresholds across sessions."""
+        try:
+            with open(self.settings_file, "wb") as file:
+                file.write(_dumps({"low_threshold": self.low_threshold,
+                                   "high_threshold": self.high_threshold}))
+        except OSError:
+            pass  # settings are a convenience; losing them only re-prompts
+
+    def find_users_with_prefix(self, prefix):
+        """
+        Finds user names starting with the given prefix.
+
+        Uses a sorted name index and binary search, so lookups stay cheap as
+        the user list grows.
+
+        Args:
+            prefix (str): The name prefix to match. An empty prefix matches everyone.
+
+        Returns:
+            list: The matching user names in sorted order.
+        """
+        i = bisect.bisect_left(self._name_index, prefix)
+        matches = []
+        while i < len(self._name_index) and self._name_index[i].startswith(prefix):
+            matches.append(self._name_index[i])
+            i += 1
+        return matches
+
     def save_graph(self, fig):
         """
         Saves the given figure as a PDF file.
@@ -136,14 +207,55 @@ class App:
         """
         Saves the given user data to a JSON file.
 
+        Writes are debounced through the Tk event loop so rapid saves collapse
+        into one disk write, and skipped entirely when nothing changed.
+
         Args:
             new_data (dict): The new user data to save.
         """
         try:
             data = self.load_user_data()
             data.update(new_data)
-            with open(self.user_data_file, "w") as file:
-                json.dump(data, file, indent=4)
+            serialized = _dumps(data)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save user information: {e}")
+            return
+        self._name_index = sorted(data)
+        if self._pending_user_data is not None:
+            if hash(serialized) == self._last_written_hash:
+                # the newest state matches disk again; drop the stale pending write
+                self._pending_user_data = None
+                if self._save_after_id is not None:
+                    self.root.after_cancel(self._save_after_id)
+                    self._save_after_id = None
+            else:
+                self._pending_user_data = serialized
+            return
+        if hash(serialized) == self._last_written_hash:
+            return
+        self._pending_user_data = serialized
+        self._save_after_id = self.root.after(300, self._flush_user_data)
+
+    def _on_close(self):
+        """Flushes any pending user data write before the window is destroyed."""
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._flush_user_data()
+        self.root.destroy()
+
+    def _flush_user_data(self):
+        """Writes the pending user data atomically via a temp-file swap."""
+        self._save_after_id = None
+        serialized = self._pending_user_data
+        if serialized is None:
+            return
+        self._pending_user_data = None
+        try:
+            tmp_path = self.user_data_file + ".tmp"
+            with open(tmp_path, "wb") as file:
+                file.write(serialized)
+            os.replace(tmp_path, self.user_data_file)
+            self._last_written_hash = hash(serialized)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save user information: {e}")
 
@@ -1,6 +1,6 @@
+from functools import cached_property
 import customtkinter as ctk
 from tkinter import messagebox
-from graph_generator import GraphGenerator
 import colors as c
 
 class AllUsersFrame(ctk.CTkFrame):
@@ -26,7 +26,6 @@ class AllUsersFrame(ctk.CTkFrame):
         """
         super().__init__(app.root, corner_radius=10)
         self.app = app
-        self.graph_generator = GraphGenerator(app)
         self.place(relwidth=1, relheight=1)
 
         button_style = {
@@ -44,6 +43,11 @@ class AllUsersFrame(ctk.CTkFrame):
         ctk.CTkButton(self, text="Show Diabetes Type Distribution by Gender", **button_style, command=self.show_gender_distribution_by_type).pack(pady=20)
         ctk.CTkButton(self, text="Go Back", command=self.go_back, fg_color=c.LIGHTER_BLUE, hover_color="#5a8bbf", text_color="white", corner_radius=10, width=150).pack(pady=20)
 
+    @cached_property
+    def graph_generator(self):
+        """Fetches the shared GraphGenerator on first use."""
+        return self.app.graph_generator
+
     def analyze_all_users(self):
         """Analyzes all users' data for BMI and diabetes type."""
         self.user_data = self.app.load_user_data()
@@ -57,9 +61,8 @@ class AllUsersFrame(ctk.CTkFrame):
             messagebox.showerror("Error", "No BMI or diabetes type data available for users.")
             return
 
-        self.users = list(self.bmi_data.keys())
-        self.bmis = [self.bmi_data[user][0] for user in self.users]
-        self.diabetes_types = [self.bmi_data[user][1] for user in self.users]
+        self.users = list(self.bmi_data)
+        self.bmis, self.diabetes_types = map(list, zip(*self.bmi_data.values()))
 
     def show_bmi_all_users(self):
         """Displays the BMI of all users."""
@@ -83,16 +86,22 @@ class AllUsersFrame(ctk.CTkFrame):
         avg_bmi_per_type = {dtype: sum(bmis) / len(bmis) for dtype, bmis in diabetes_type_bmi.items()}
         self.graph_generator.show_avg_bmi_by_type(avg_bmi_per_type)
 
+    def _user_df(self):
+        """Returns all users' records as a DataFrame indexed by user name."""
+        import pandas as pd
+
+        return pd.DataFrame.from_dict(self.user_data, orient='index')
+
     def show_gender_distribution_by_type(self):
         """Displays the distribution of diabetes types by gender."""
         self.analyze_all_users()
         if not self.user_data:
             return
 
-        gender_data = {dtype: [] for dtype in set(self.diabetes_types)}
-        for user, data in self.user_data.items():
-            if 'gender' in data and 'diabetes_type' in data:
-                gender_data[data['diabetes_type']].append(data['gender'])
+        df = self._user_df()
+        # reindex tolerates records where no user has the column at all
+        gender_data = (df.reindex(columns=['diabetes_type', 'gender']).dropna()
+                       .groupby('diabetes_type')['gender'].apply(list).to_dict())
 
         self.graph_generator.show_gender_distribution_by_type(gender_data)
 
@@ -102,10 +111,9 @@ class AllUsersFrame(ctk.CTkFrame):
         if not self.user_data:
             return
 
-        age_data = {dtype: [] for dtype in set(self.diabetes_types)}
-        for user, data in self.user_data.items():
-            if 'age' in data and 'diabetes_type' in data:
-                age_data[data['diabetes_type']].append(data['age'])
+        df = self._user_df()
+        age_data = (df.reindex(columns=['diabetes_type', 'age']).dropna()
+                    .groupby('diabetes_type')['age'].apply(list).to_dict())
 
         self.graph_generator.show_age_distribution_by_type(age_data)
 
@@ -1,12 +1,32 @@
+import functools
 import tkinter as tk
 import customtkinter as ctk
 from tkinter import messagebox, font
-from tkcalendar import Calendar
 from datetime import datetime
 import colors as c
 
-low_threshold = None
-high_threshold = None
+GENDERS = ("Male", "Female", "Other")
+DIABETES_OPTIONS = (
+    "Type 1", "Type 2", "Gestational Diabetes", "LADA", "MODY",
+    "Neonatal Diabetes", "Cystic Fibrosis-related Diabetes", "Steroid-induced Diabetes", "Other"
+)
+# (label text, attribute name, placeholder, grid row, bound event, handler name)
+FIELDS = (
+    ("Name:", "name_entry", "Enter your name", 1, None, None),
+    ("Date of Birth:", "dob_entry", "YYYY-MM-DD", 3, "<Button-1>", "open_calendar"),
+    ("Weight (kg):", "weight_entry", "Enter your weight", 4, "<KeyRelease>", "update_bmi"),
+    ("Height (cm):", "height_entry", "Enter your height", 5, "<KeyRelease>", "update_bmi"),
+)
+
+def _init_fonts():
+    """Registers the named calendar title font with Tk once per process."""
+    if "CalTitle" not in font.names():
+        font.Font(name="CalTitle", size=16, weight="bold")
+
+@functools.lru_cache(maxsize=256)
+def _parse_dob(dob):
+    """Parses a YYYY-MM-DD date of birth by slicing the fixed-format string."""
+    return datetime(int(dob[0:4]), int(dob[5:7]), int(dob[8:10]))
 
 class InfoFrame(ctk.CTkFrame):
     """
@@ -17,12 +37,12 @@ class InfoFrame(ctk.CTkFrame):
         user_info: Information about the users.
         from_welcome_frame: Flag to indicate if the user is coming from the welcome frame.
         name_entry: Entry widget for entering the user's name.
-        gender_var: Variable for storing the user's gender.
+        gender_seg: Segmented button for selecting the user's gender.
         dob_entry: Entry widget for entering the user's date of birth.
         weight_entry: Entry widget for entering the user's weight.
         height_entry: Entry widget for entering the user's height.
         bmi_label: Label widget for displaying the user's BMI.
-        diabetes_var: Variable for storing the user's diabetes type.
+        diabetes_combo: Combo box for selecting the user's diabetes type.
 
     Args:
         app: The main application instance.
@@ -36,54 +56,55 @@ class InfoFrame(ctk.CTkFrame):
         """
         super().__init__(app.root, corner_radius=10)
         self.app = app
-        self.place(relwidth=1, relheight=1)
+        # grid with weighted cells re-layouts cheaper than place's relative
+        # geometry, which recomputes on every window resize
+        app.root.grid_rowconfigure(0, weight=1)
+        app.root.grid_columnconfigure(0, weight=1)
+        self.grid(row=0, column=0, sticky="nsew")
         self.user_info = None
         self.from_welcome_frame = True
-
-        form_frame = ctk.CTkFrame(self, fg_color=c.BG_COLOR)
+        self._bmi_after_id = None
+        self._last_bmi_inputs = None
+        self._last_bmi_text = None
+        self._cached_metrics = None
+
+        # fixed geometry with propagation off keeps widget insertions and
+        # resizes from re-triggering layout passes up the frame tree
+        form_frame = ctk.CTkFrame(self, fg_color=c.BG_COLOR, width=480, height=480)
+        form_frame.pack_propagate(False)
+        form_frame.grid_propagate(False)
         form_frame.pack(pady=10, padx=20)
+        form_frame.grid_columnconfigure((0, 1), weight=1)
 
         ctk.CTkLabel(form_frame,text="Enter Your Information",font=("Helvetica", 18, "bold"),text_color="#2C3E50"
         ).grid(row=0, column=0, columnspan=2, pady=10)
 
-        ctk.CTkLabel(form_frame, text="Name:", text_color="#333333").grid(row=1, column=0, pady=5, sticky="e")
-        self.name_entry = ctk.CTkEntry(form_frame, placeholder_text="Enter your name")
-        self.name_entry.grid(row=1, column=1, pady=5, padx=10)
+        for label, attr, placeholder, row, event, handler in FIELDS:
+            ctk.CTkLabel(form_frame, text=label, text_color="#333333").grid(row=row, column=0, pady=5, sticky="e")
+            entry = ctk.CTkEntry(form_frame, placeholder_text=placeholder)
+            entry.grid(row=row, column=1, pady=5, padx=10)
+            if event:
+                entry.bind(event, getattr(self, handler))
+            setattr(self, attr, entry)
 
         ctk.CTkLabel(form_frame, text="Gender:", text_color="#333333").grid(row=2, column=0, pady=5, sticky="e")
-        self.gender_var = tk.StringVar(value=None)
-        gender_frame = ctk.CTkFrame(form_frame, fg_color=c.BG_COLOR)
-        gender_frame.grid(row=2, column=1, pady=5, padx=10)
-        for gender in ["Male", "Female", "Other"]:
-            ctk.CTkRadioButton(gender_frame, text=gender, variable=self.gender_var, value=gender, text_color="#333333").pack(side="left", padx=5)
-
-        ctk.CTkLabel(form_frame, text="Date of Birth:", text_color="#333333").grid(row=3, column=0, pady=5, sticky="e")
-        self.dob_entry = ctk.CTkEntry(form_frame, placeholder_text="YYYY-MM-DD")
-        self.dob_entry.grid(row=3, column=1, pady=5, padx=10)
-        self.dob_entry.bind("<Button-1>", self.open_calendar)
-
-        ctk.CTkLabel(form_frame, text="Weight (kg):", text_color="#333333").grid(row=4, column=0, pady=5, sticky="e")
-        self.weight_entry = ctk.CTkEntry(form_frame, placeholder_text="Enter your weight")
-        self.weight_entry.grid(row=4, column=1, pady=5, padx=10)
-        self.weight_entry.bind("<KeyRelease>", self.update_bmi)
-
-        ctk.CTkLabel(form_frame, text="Height (cm):", text_color="#333333").grid(row=5, column=0, pady=5, sticky="e")
-        self.height_entry = ctk.CTkEntry(form_frame, placeholder_text="Enter your height")
-        self.height_entry.grid(row=5, column=1, pady=5, padx=10)
-        self.height_entry.bind("<KeyRelease>", self.update_bmi)
-
-        self.bmi_label = ctk.CTkLabel(form_frame, text="BMI: ", font=("Helvetica", 14, "bold"), text_color="#2C3E50")
+        self.gender_seg = ctk.CTkSegmentedButton(form_frame, values=list(GENDERS))
+        self.gender_seg.grid(row=2, column=1, pady=5, padx=10)
+
+        for entry in (self.weight_entry, self.height_entry):
+            vcmd = (self.register(functools.partial(self._validate_numeric_key, entry)), "%P")
+            entry.configure(validate="key", validatecommand=vcmd)
+
+        # A native tk.Label updates via a direct text set, unlike the
+        # canvas-drawn CTkLabel which re-renders on every configure.
+        self.bmi_label = tk.Label(form_frame, text="BMI: ", bg=c.BG_COLOR, fg="#2C3E50",
+                                  font=("Helvetica", 14, "bold"))
         self.bmi_label.grid(row=6, column=0, columnspan=2, pady=10)
 
-        diabetes_options = [
-            "Type 1", "Type 2", "Gestational Diabetes", "LADA", "MODY",
-            "Neonatal Diabetes", "Cystic Fibrosis-related Diabetes", "Steroid-induced Diabetes", "Other"
-        ]
         ctk.CTkLabel(form_frame, text="Diabetes Type:", text_color="#333333").grid(row=7, column=0, pady=5, sticky="e")
-        self.diabetes_var = tk.StringVar(value="Choose Diabetes Type")
-        ctk.CTkComboBox(form_frame, values=diabetes_options, variable=self.diabetes_var).grid(
-            row=7, column=1, pady=20,padx=10
-        )
+        self.diabetes_combo = ctk.CTkComboBox(form_frame, values=list(DIABETES_OPTIONS))
+        self.diabetes_combo.set("Choose Diabetes Type")
+        self.diabetes_combo.grid(row=7, column=1, pady=20, padx=10)
 
         ctk.CTkButton(form_frame, text="Save Information", command=self.save_user_info, text_color="white", fg_color=c.VIBRANT_BLUE, hover_color=c.BLUE).grid(row=8, column=0, columnspan=2)
         ctk.CTkButton(form_frame, text="Go Back", command=self.go_back, text_color="white", fg_color=c.LIGHT_BLUE, hover_color=c.LIGHTER_BLUE).grid(row=9, column=0, columnspan=2, pady=10)
@@ -97,26 +118,54 @@ class InfoFrame(ctk.CTkFrame):
             AttributeError: If any of the input fields or the `user_info`
                 dictionary is not properly initialized before calling this method.
         """
-        if self.user_info:
-            self.name_entry.delete(0, tk.END)
-            self.name_entry.insert(0, self.app.selected_user)
-            self.gender_var.set(self.user_info.get("gender", "Male"))
-            self.dob_entry.delete(0, tk.END)
-            self.dob_entry.insert(0, self.user_info.get("dob", ""))
-            self.weight_entry.delete(0, tk.END)
-            self.weight_entry.insert(0, self.user_info.get("weight", ""))
-            self.height_entry.delete(0, tk.END)
-            self.height_entry.insert(0, self.user_info.get("height", ""))
-            self.diabetes_var.set(self.user_info.get("diabetes_type", "Type 1"))
-            self.update_bmi()
+        user_info = self.user_info
+        if user_info:
+            self._set_if_changed(self.name_entry, self.app.selected_user)
+            self.gender_seg.set(user_info.get("gender", "Male"))
+            self._set_if_changed(self.dob_entry, user_info.get("dob", ""))
+            weight_changed = self._set_if_changed(self.weight_entry, user_info.get("weight", ""))
+            height_changed = self._set_if_changed(self.height_entry, user_info.get("height", ""))
+            self.diabetes_combo.set(user_info.get("diabetes_type", "Type 1"))
+            if weight_changed or height_changed:
+                self.update_bmi()
+
+    @staticmethod
+    def _set_if_changed(entry, value):
+        """
+        Rewrites an entry only when its content differs from the value.
+
+        Args:
+            entry (ctk.CTkEntry): The entry widget to update.
+            value: The desired content.
+
+        Returns:
+            bool: True if the entry was rewritten.
+        """
+        text = str(value)
+        if entry.get() == text:
+            return False
+        entry.delete(0, tk.END)
+        entry.insert(0, text)
+        return True
 
     def open_calendar(self, event):
         """
         Opens a pop-up calendar window for selecting a date of birth.
 
+        The window is built once and hidden on close, so reopening only has
+        to show it again instead of recreating the calendar widgets.
+
         Args:
             event: The triggering event object.
         """
+        from tkcalendar import Calendar
+
+        if getattr(self, "cal_window", None) is not None and self.cal_window.winfo_exists():
+            self.cal.selection_set(datetime.now().date())
+            self.cal_window.deiconify()
+            self.cal_window.lift()
+            return
+
         self.cal_window = ctk.CTkToplevel(self.app.root)
         self.cal_window.title("Select Date of Birth")
         self.cal_window.geometry("300x300")
@@ -128,7 +177,7 @@ class InfoFrame(ctk.CTkFrame):
 
         today = datetime.now().date()
 
-        title_font = font.Font(size=16, weight='bold')
+        _init_fonts()
 
         self.cal = Calendar(
             self.cal_window,
@@ -139,7 +188,7 @@ class InfoFrame(ctk.CTkFrame):
             day=1,
             maxdate=today,
         )
-        self.cal["font"] = title_font
+        self.cal["font"] = "CalTitle"
 
         self.cal.grid(row=0, column=0, sticky='nsew')
 
@@ -152,34 +201,98 @@ class InfoFrame(ctk.CTkFrame):
         """
         self.dob_entry.delete(0, tk.END)
         self.dob_entry.insert(0, self.cal.get_date())
-        self.cal_window.destroy()
+        self.cal_window.withdraw()
 
     def update_bmi(self, event=None):
         """
-        Updates the BMI label based on the weight and height entries.
+        Schedules a BMI label update, coalescing rapid keystrokes.
+
+        Only the last edit in a 150 ms window triggers the actual recompute,
+        so typing does not redraw the label on every key.
 
         Args:
             event: The triggering event object (optional).
         """
+        if self._bmi_after_id is not None:
+            self.after_cancel(self._bmi_after_id)
+        self._bmi_after_id = self.after(150, self._do_update_bmi)
+
+    @staticmethod
+    def _validate_numeric_key(entry, text):
+        """
+        Validates an edit to a numeric entry.
+
+        CTkEntry inserts its placeholder text programmatically through the
+        same validation hook, so placeholder activation is let through.
+
+        Args:
+            entry (ctk.CTkEntry): The entry being edited.
+            text (str): The content the edit would produce.
+
+        Returns:
+            bool: True if the edit should be accepted.
+        """
+        if getattr(entry, "_placeholder_text_active", False) or text == entry.cget("placeholder_text"):
+            return True
+        return InfoFrame._is_float_prefix(text)
+
+    @staticmethod
+    def _is_float_prefix(text):
+        """
+        Accepts a keystroke only while the entry stays a valid float prefix.
+
+        Args:
+            text (str): The entry content the keystroke would produce.
+
+        Returns:
+            bool: True if the text is empty or a digits-and-one-dot number.
+        """
+        return text == "" or (text.count(".") <= 1 and text.replace(".", "", 1).isdigit())
+
+    def _do_update_bmi(self):
+        """Recomputes the BMI label from the weight and height entries."""
+        self._bmi_after_id = None
+        inputs = (self.weight_entry.get(), self.height_entry.get())
+        if inputs == self._last_bmi_inputs:
+            return
+        self._last_bmi_inputs = inputs
+        if not inputs[0] or not inputs[1]:
+            self._cached_metrics = None
+            self._set_bmi_text("BMI: ")
+            return
         try:
-            weight = float(self.weight_entry.get())
-            height = float(self.height_entry.get()) / 100
-            bmi = weight / (height ** 2)
-            self.bmi_label.configure(text=f"BMI: {bmi:.2f}")
-        except ValueError:
-            self.bmi_label.configure(text="BMI: ")
+            weight = float(inputs[0])
+            height = float(inputs[1]) / 100
+            bmi = weight * (1.0 / (height * height))
+            self._cached_metrics = (weight, height, bmi)
+            self._set_bmi_text(f"BMI: {bmi:.2f}")
+        except (ValueError, ZeroDivisionError):
+            self._cached_metrics = None
+            self._set_bmi_text("BMI: ")
+
+    def _set_bmi_text(self, text):
+        """Reconfigures the BMI label only when its text actually changed."""
+        if text != self._last_bmi_text:
+            self._last_bmi_text = text
+            self.bmi_label.configure(text=text)
 
     def save_user_info(self):
         """
         Saves the user information and updates the main application data.
         """
 
+        app = self.app
+        users_info = app.users_info
+        main_frame = app.main_frame
+
+        # All O(1) presence checks run before any parsing or arithmetic, so
+        # an invalid submit costs a few hash probes at most.
         name = self.name_entry.get()
         if not name:
             messagebox.showerror("Error", "Name is required.")
             return
 
-        if name in self.app.users_info and name != self.app.main_frame.selected_user:
+        if name in users_info and name != main_frame.selected_user:
             messagebox.showerror("Error", "User already exists. Please choose a different name.")
             return
 
@@ -187,40 +300,49 @@ class InfoFrame(ctk.CTkFrame):
         if not dob:
             messagebox.showerror("Error", "Date of birth is required.")
             return
-        birth_date = datetime.strptime(dob, '%Y-%m-%d')
-        today = datetime.today()
-        age = today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
+
+        diabetes_type = self.diabetes_combo.get()
+        if diabetes_type == "Choose Diabetes Type":
+            messagebox.showerror("Error", "Please select a diabetes type.")
+            return
 
         try:
-            weight = float(self.weight_entry.get())
-            height = float(self.height_entry.get()) / 100
-            bmi = weight / (height ** 2)
-            self.bmi_label.configure(text=f"BMI: {bmi:.2f}")
+            birth_date = _parse_dob(dob) if len(dob) == 10 else None
         except ValueError:
-            messagebox.showerror("Error", "Please enter valid weight and height.")
+            birth_date = None
+        if birth_date is None:
+            messagebox.showerror("Error", "Date of birth must be in YYYY-MM-DD format.")
             return
+        today = datetime.today()
+        age = today.year - birth_date.year - ((today.month, today.day) < (birth_date.month, birth_date.day))
 
-        if self.diabetes_var.get() == "Choose Diabetes Type":
-            messagebox.showerror("Error", "Please select a diabetes type.")
+        if (self.weight_entry.get(), self.height_entry.get()) != self._last_bmi_inputs:
+            if self._bmi_after_id is not None:
+                self.after_cancel(self._bmi_after_id)
+            self._do_update_bmi()
+        if self._cached_metrics is None:
+            messagebox.showerror("Error", "Please enter valid weight and height.")
             return
+        weight, height, bmi = self._cached_metrics
 
-
-        self.app.users_info[name] = {
-            "gender": self.gender_var.get(),
+        new_record = {
+            "gender": self.gender_seg.get(),
             "dob": dob,
             "age": age,
             "weight": weight,
             "height": height * 100,
             "bmi": bmi,
-            "diabetes_type": self.diabetes_var.get()
+            "diabetes_type": diabetes_type
         }
 
-        self.app.save_user_data(self.app.users_info)
-        messagebox.showinfo("Info", "User information saved successfully!")
+        if users_info.get(name) != new_record:
+            users_info[name] = new_record
+            app.save_user_data(users_info)
+            messagebox.showinfo("Info", "User information saved successfully!")
 
-        self.app.main_frame.selected_user = name
-        self.app.main_frame.populate_user_data()
-        self.app.show_frame(self.app.main_frame)
+        main_frame.selected_user = name
+        main_frame.populate_user_data()
+        app.show_frame(main_frame)
 
     def clear_user_info(self):
         """
@@ -228,15 +350,17 @@ class InfoFrame(ctk.CTkFrame):
         """
         self.name_entry.delete(0, tk.END)
         self.name_entry.configure(placeholder_text="Enter your name")
-        self.gender_var.set("")
+        self.gender_seg.set("")
         self.dob_entry.delete(0, tk.END)
         self.dob_entry.configure(placeholder_text="YYYY-MM-DD")
         self.weight_entry.delete(0, tk.END)
         self.weight_entry.configure(placeholder_text="Enter your weight")
         self.height_entry.delete(0, tk.END)
         self.height_entry.configure(placeholder_text="Enter your height")
-        self.bmi_label.configure(text="BMI: ")
-        self.diabetes_var.set("Choose Diabetes Type")
+        self._set_bmi_text("BMI: ")
+        self.diabetes_combo.set("Choose Diabetes Type")
+        self._last_bmi_inputs = None
+        self._cached_metrics = None
 
         self.user_info = None
 
@@ -244,9 +368,10 @@ class InfoFrame(ctk.CTkFrame):
         """
         Navigates back to the previous frame based on the user's information.
         """
-        if self.app.selected_user:
-            self.app.show_frame(self.app.main_frame)
+        app = self.app
+        if app.selected_user:
+            app.show_frame(app.main_frame)
         else:
-            self.app.show_frame(self.app.welcome_frame)
-            self.app.welcome_frame.hide_user_frame()
+            app.show_frame(app.welcome_frame)
+            app.welcome_frame.hide_user_frame()
 
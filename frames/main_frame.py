@@ -1,13 +1,37 @@
+import os
+import threading
+from functools import cached_property, lru_cache
 from tkinter import messagebox, filedialog
 import customtkinter as ctk
-import pandas as pd
 import colors as c
-from graph_generator import GraphGenerator
-from insights_generator import InsightsGenerator
 
 
-low_threshold = None
-high_threshold = None
+@lru_cache(maxsize=4)
+def _read_dataset(file_path, mtime):
+    """
+    Reads and prepares a dataset, cached on the file path and mtime.
+
+    Args:
+        file_path (str): The CSV path.
+        mtime (float): The file's modification time, part of the cache key.
+
+    Returns:
+        DataFrame: The prepared dataset with a parsed Datetime column.
+    """
+    import pandas as pd
+
+    wanted = {"Date", "Time", "Meal", "Blood Glucose Level (mg/dL)", "Notes"}
+    usecols = [col for col in pd.read_csv(file_path, nrows=0).columns if col in wanted]
+    dtypes = {"Blood Glucose Level (mg/dL)": "float32", "Meal": "category"}
+    try:
+        df = pd.read_csv(file_path, engine="pyarrow", usecols=usecols, dtype=dtypes)
+    except (ImportError, ValueError):
+        df = pd.read_csv(file_path, usecols=usecols, dtype=dtypes)
+    if {"Date", "Time"} <= set(df.columns):
+        from insights_generator import _parse_dates, _time_of_day
+
+        df["Datetime"] = _parse_dates(df["Date"]) + _time_of_day(df["Time"])
+    return df
 
 class MainFrame(ctk.CTkFrame):
     """
@@ -42,10 +66,10 @@ class MainFrame(ctk.CTkFrame):
         super().__init__(app.root, corner_radius=10)
         self.app = app
         self.data_file = None
+        self.cached_df = None
         self.place(relwidth=1, relheight=1)
-        self.graph_generator = GraphGenerator(app)
-        self.insights_generator = InsightsGenerator(app)
         self.selected_user = None
+        self._buttons_enabled = False
 
         self.welcome_label = ctk.CTkLabel(
             self, text="", font=("Arial", 24, "bold"), fg_color="transparent"
@@ -151,29 +175,68 @@ class MainFrame(ctk.CTkFrame):
         )
         self.go_back_button.grid(row=4, column=0, padx=20, pady=10)
 
+    @cached_property
+    def graph_generator(self):
+        """Fetches the shared GraphGenerator on first use."""
+        return self.app.graph_generator
+
+    @cached_property
+    def insights_generator(self):
+        """Creates the InsightsGenerator on first use."""
+        from insights_generator import InsightsGenerator
+        return InsightsGenerator(self.app)
+
     def load_file(self):
-        """Allows the user to load a CSV file and enables buttons."""
+        """Allows the user to load a CSV file and enables buttons.
+
+        Only the first few rows are read here to validate the file; the full
+        parse is deferred until the first action needs the data.
+        """
         file_path = filedialog.askopenfilename(filetypes=[("CSV Files", "*.csv")])
         if file_path:
+            import pandas as pd
+
             try:
-                pd.read_csv(file_path)
-                self.data_file = file_path
-                self.dataset_label.configure(text=f"Dataset: {file_path.split('/')[-1]}")
-                self.enable_buttons()
+                head = pd.read_csv(file_path, nrows=5)
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load dataset: {e}")
+                return
+            if not {"Date", "Time", "Blood Glucose Level (mg/dL)"} <= set(head.columns):
+                messagebox.showerror(
+                    "Error", "Dataset must include 'Date', 'Time', and 'Blood Glucose Level (mg/dL)' columns."
+                )
+                return
+            self.cached_df = None
+            self.data_file = file_path
+            self.dataset_label.configure(text=f"Dataset: {file_path.split('/')[-1]}")
+            self.enable_buttons()
+            threading.Thread(target=self._prefetch_csv, args=(file_path,), daemon=True).start()
         else:
             messagebox.showinfo("Info", "No file selected.")
 
+    def _prefetch_csv(self, file_path):
+        """Parses the CSV into the shared cache so the first graph click is instant."""
+        from graph_generator import _load_csv
+        try:
+            _load_csv(file_path)
+        except Exception:
+            pass  # errors surface on the user's first real action
+
     def enable_buttons(self):
         """Enables buttons for graphing and insights generation."""
+        if self._buttons_enabled:
+            return
         for button in [self.graph_time_button, self.graph_meal_button, self.insights_button]:
             button.configure(state="normal", fg_color=c.LIGHT_BLUE)
+        self._buttons_enabled = True
 
     def disable_buttons(self):
         """Disables buttons for graphing and insights generation."""
+        if not self._buttons_enabled:
+            return
         for button in [self.graph_time_button, self.graph_meal_button, self.insights_button]:
             button.configure(state="disabled", fg_color="gray")
+        self._buttons_enabled = False
 
     def go_back(self):
         """Navigates back to the welcome frame. Hides user frame and clears user info."""
@@ -197,12 +260,39 @@ class MainFrame(ctk.CTkFrame):
             return
         self.graph_generator.make_graph_levels_meal(self.data_file)
 
+    def _refresh_cached_df(self):
+        """
+        Re-reads the dataset through the cache if the file changed on disk.
+
+        Files past the streaming threshold are deliberately left unloaded so
+        the insights generator folds them chunk-by-chunk instead of pulling
+        the whole file into RAM here.
+
+        Returns:
+            bool: True if the dataset is ready for use, False after a parse failure.
+        """
+        from insights_generator import _STREAM_THRESHOLD_BYTES
+
+        try:
+            if os.path.getsize(self.data_file) > _STREAM_THRESHOLD_BYTES:
+                self.cached_df = None
+                return True
+            self.cached_df = _read_dataset(self.data_file, os.path.getmtime(self.data_file))
+            return True
+        except Exception as e:
+            self.cached_df = None
+            messagebox.showerror("Error", f"Failed to load dataset: {e}")
+            return False
+
     def generate_insights(self):
         """Generates insights from the loaded dataset."""
         if self.data_file is None:
             messagebox.showerror("Error", "No dataset loaded. Please choose a file first.")
             return
+        if not self._refresh_cached_df():
+            return
         self.insights_generator.data_file = self.data_file
+        self.insights_generator.data_df = self.cached_df
         self.insights_generator.show_insights()
 
     def populate_user_data(self):
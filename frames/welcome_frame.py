@@ -3,9 +3,6 @@ import customtkinter as ctk
 from tkinter import messagebox
 import colors as c
 
-low_threshold = None
-high_threshold = None
-
 class WelcomeFrame(ctk.CTkFrame):
     """
     Welcome frame for the application.
@@ -89,7 +86,7 @@ class WelcomeFrame(ctk.CTkFrame):
             messagebox.showerror("Error", "No user data found. Please create a new user.")
             return
 
-        user_list = list(self.user_info.keys())
+        user_list = self.app.find_users_with_prefix("") or sorted(self.user_info)
         self.user_var = tk.StringVar(value=user_list[0])
 
         # Create the user frame
@@ -110,18 +107,24 @@ class WelcomeFrame(ctk.CTkFrame):
         Raises:
             KeyError: If the selected user data is not found.
         """
-        self.app.info_frame.from_welcome_frame = True
-        self.selected_user = self.user_var.get()
-        self.app.selected_user = self.selected_user
-        self.app.users_info = self.app.load_user_data()
-        if self.app.selected_user in self.app.users_info:
-            self.app.info_frame.user_info = self.app.load_user_data(self.app.selected_user)
-            self.app.info_frame.populate_user_info()
-            self.app.main_frame.selected_user = self.app.selected_user
-            self.app.main_frame.populate_user_data()
-            self.app.show_frame(self.app.main_frame)
+        app = self.app
+        info_frame = app.info_frame
+        main_frame = app.main_frame
+        selected = self.user_var.get()
+
+        info_frame.from_welcome_frame = True
+        self.selected_user = selected
+        app.selected_user = selected
+        users_info = app.load_user_data()
+        app.users_info = users_info
+        if selected in users_info:
+            info_frame.user_info = users_info[selected]
+            info_frame.populate_user_info()
+            main_frame.selected_user = selected
+            main_frame.populate_user_data()
+            app.show_frame(main_frame)
         else:
-            self.app.custom_error_dialog("Error", "User data not found. Please check the user list and try again.")
+            app.custom_error_dialog("Error", "User data not found. Please check the user list and try again.")
 
     def hide_user_frame(self):
         """
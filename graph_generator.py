@@ -1,11 +1,163 @@
-import numpy as np
-import pandas as pd
-from matplotlib import pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import math
+import os
+import tkinter as tk
 import customtkinter as ctk
-from tkinter import messagebox, filedialog
+from tkinter import messagebox
 import colors as c
-import matplotlib.colors as mcolors
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernel still runs as plain Python
+    def njit(**kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+_REQ_TIME_COLS = {"Date", "Time", "Blood Glucose Level (mg/dL)"}
+_REQ_MEAL_COLS = {"Meal", "Blood Glucose Level (mg/dL)"}
+
+_df_cache = {}
+
+_style_applied = False
+
+def _apply_style():
+    """Applies the shared chart style defaults to matplotlib once per process."""
+    global _style_applied
+    if _style_applied:
+        return
+    import matplotlib
+    matplotlib.rcParams.update({
+        "axes.grid": True,
+        "grid.linestyle": "--",
+        "grid.alpha": 0.7,
+        "grid.linewidth": 0.5,
+        "figure.autolayout": True,
+    })
+    _style_applied = True
+
+def _load_csv(data_file):
+    """
+    Loads a CSV file, reusing the parsed DataFrame until the file changes on disk.
+
+    Args:
+        data_file (str): The path to the CSV file containing the data.
+
+    Returns:
+        DataFrame: The parsed data, with a 'Datetime' column when Date/Time are present.
+    """
+    import pandas as pd
+
+    mtime = os.path.getmtime(data_file)
+    cached = _df_cache.get(data_file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    dtypes = {"Blood Glucose Level (mg/dL)": "float32"}
+    try:
+        data = pd.read_csv(data_file, engine="pyarrow", parse_dates=["Date"], date_format="%Y-%m-%d",
+                           dtype=dtypes)
+    except (ImportError, ValueError):
+        try:
+            data = pd.read_csv(data_file, parse_dates=["Date"], date_format="%Y-%m-%d", dtype=dtypes)
+        except ValueError:
+            data = pd.read_csv(data_file)
+    if _REQ_TIME_COLS <= set(data.columns):
+        from insights_generator import _time_of_day
+
+        date = pd.to_datetime(data["Date"], cache=True)
+        times = data["Time"]
+        unique_times = times.unique()
+        time_map = dict(zip(unique_times, _time_of_day(pd.Series(unique_times))))
+        data["Datetime"] = date + times.map(time_map)
+    _df_cache[data_file] = (mtime, data)
+    return data
+
+def _lttb(x, y, n_out):
+    """
+    Downsamples a series to n_out points with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last points and, per bucket, the point forming the
+    largest triangle with the previously kept point and the next bucket mean,
+    so the drawn shape survives while the point count drops.
+
+    Args:
+        x (ndarray): The x values (datetime64 or numeric).
+        y (ndarray): The y values.
+        n_out (int): The target number of points.
+
+    Returns:
+        tuple: The downsampled (x, y) arrays.
+    """
+    import numpy as np
+
+    n = y.size
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    xv = x.view("i8").astype(np.float64) if x.dtype.kind in "mM" else x.astype(np.float64)
+    yv = y.astype(np.float64)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    kept = np.empty(n_out, dtype=np.intp)
+    kept[0] = 0
+    kept[-1] = n - 1
+
+    anchor = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], max(edges[i] + 1, edges[i + 1])
+        if i < n_out - 3:
+            nx_lo, nx_hi = edges[i + 1], max(edges[i + 1] + 1, edges[i + 2])
+            bx, by = xv[nx_lo:nx_hi].mean(), yv[nx_lo:nx_hi].mean()
+        else:
+            bx, by = xv[-1], yv[-1]
+        area = np.abs((xv[anchor] - bx) * (yv[lo:hi] - yv[anchor])
+                      - (xv[anchor] - xv[lo:hi]) * (by - yv[anchor]))
+        anchor = lo + int(area.argmax())
+        kept[i + 1] = anchor
+    return x[kept], y[kept]
+
+@njit(cache=True)
+def _scan_peaks(y, filtered, out, lag, threshold, influence):
+    """Smoothed z-score scan marking points deviating from the rolling window."""
+    n = y.shape[0]
+    if n <= lag:
+        return
+    total = 0.0
+    total_sq = 0.0
+    for i in range(lag):
+        total += filtered[i]
+        total_sq += filtered[i] * filtered[i]
+    for i in range(lag, n):
+        mean = total / lag
+        var = total_sq / lag - mean * mean
+        std = math.sqrt(var) if var > 0.0 else 0.0
+        if std > 0.0 and abs(y[i] - mean) > threshold * std:
+            if y[i] > mean:
+                out[i] = 1
+            filtered[i] = influence * y[i] + (1.0 - influence) * filtered[i - 1]
+        else:
+            filtered[i] = y[i]
+        total += filtered[i] - filtered[i - lag]
+        total_sq += filtered[i] * filtered[i] - filtered[i - lag] * filtered[i - lag]
+
+def _find_peaks(y, lag=30, threshold=3.0, influence=0.5):
+    """
+    Finds upward glucose spikes with a rolling z-score detector.
+
+    Args:
+        y (ndarray): The glucose values.
+        lag (int): The rolling window length.
+        threshold (float): The number of standard deviations marking a spike.
+        influence (float): The weight of spike samples in the rolling window.
+
+    Returns:
+        ndarray: Indices of the detected peaks.
+    """
+    import numpy as np
+
+    values = y.astype(np.float64)
+    filtered = values.copy()
+    out = np.zeros(values.size, np.int8)
+    _scan_peaks(values, filtered, out, lag, threshold, influence)
+    return np.flatnonzero(out == 1)
 
 class GraphGenerator:
     """
@@ -26,28 +178,67 @@ class GraphGenerator:
             app: The main application instance.
         """
         self.app = app
+        self._ts_window = None
+        self._ts_fig = None
+        self._ts_ax = None
+        self._ts_canvas = None
+        self._ts_artists = None
+        self._ts_bg = None
+        self._static_window = None
+        self._static_fig = None
+        self._static_ax = None
+        self._static_canvas = None
+        self._static_label = None
+        self._static_photo = None
 
     def make_graph_levels_over_time(self, data_file):
         """
         Creates a graph of blood glucose levels over time.
 
+        The figure, canvas and data artists are created once and reused on
+        later calls; redraws only blit the updated artists over a cached
+        background instead of rebuilding the whole figure.
+
         Args:
             data_file (str): The path to the CSV file containing the data.
         """
-        data = pd.read_csv(data_file)
-        if {"Date", "Time", "Blood Glucose Level (mg/dL)"}.issubset(data.columns):
-            data["Datetime"] = pd.to_datetime(data["Date"] + " " + data["Time"])
-
-            fig, ax = plt.subplots(figsize=(12, 6))
-
-            ax.plot(data["Datetime"], data["Blood Glucose Level (mg/dL)"], label="Glucose Levels", marker="o",
-                    color="skyblue", linewidth=2)
-
-            hypo_data = data[data["Blood Glucose Level (mg/dL)"] < 70]
-            hyper_data = data[data["Blood Glucose Level (mg/dL)"] > 180]
-
-            ax.scatter(hypo_data["Datetime"], hypo_data["Blood Glucose Level (mg/dL)"], color="red", label="Hypoglycemia", zorder=5)
-            ax.scatter(hyper_data["Datetime"], hyper_data["Blood Glucose Level (mg/dL)"], color="darkred", label="Hyperglycemia", zorder=5)
+        import numpy as np
+        from matplotlib import dates as mdates
+
+        try:
+            data = _load_csv(data_file)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load dataset: {e}")
+            return
+        if not (_REQ_TIME_COLS <= set(data.columns)):
+            messagebox.showerror(
+                "Error", "Dataset must include 'Date', 'Time', and 'Blood Glucose Level (mg/dL)' columns."
+            )
+            return
+
+        levels = data["Blood Glucose Level (mg/dL)"].to_numpy()
+        datetimes = data["Datetime"].to_numpy()
+        hypo_mask = levels < 70
+        hyper_mask = levels > 180
+        peak_idx = _find_peaks(levels)
+
+        if self._ts_window is None or not self._ts_window.winfo_exists():
+            self._init_ts_window()
+
+        ax = self._ts_ax
+        plot_x, plot_y = datetimes, levels
+        if levels.size > 4000:
+            plot_x, plot_y = _lttb(datetimes, levels, int(ax.bbox.width * 2))
+        marker = "o" if plot_y.size < 500 else ""
+
+        if self._ts_artists is None:
+            line, = ax.plot(plot_x, plot_y, label="Glucose Levels", marker=marker,
+                            color="skyblue", linewidth=2)
+            line.set_rasterized(True)
+            hypo = ax.scatter(datetimes[hypo_mask], levels[hypo_mask], color="red", label="Hypoglycemia", zorder=5)
+            hyper = ax.scatter(datetimes[hyper_mask], levels[hyper_mask], color="darkred", label="Hyperglycemia", zorder=5)
+            peaks = ax.scatter(datetimes[peak_idx], levels[peak_idx], color="orange", label="Spikes", zorder=4)
+            self._ts_artists = (line, hypo, hyper, peaks)
 
             ax.set_title("Blood Glucose Monitoring", fontsize=24, fontweight='bold')
             ax.set_xlabel("Datetime", fontsize=20, fontweight='bold')
@@ -55,13 +246,71 @@ class GraphGenerator:
             ax.tick_params(axis="x", rotation=45, labelsize=16)
             ax.tick_params(axis="y", labelsize=16)
             ax.legend(fontsize=18, loc='upper right', frameon=True, shadow=True, borderpad=1)
-            ax.grid(alpha=0.7, linestyle="--", linewidth=0.5)
-
-            self.display_graph_window(fig)
+            self._ts_canvas.draw()
         else:
-            messagebox.showerror(
-                "Error", "Dataset must include 'Date', 'Time', and 'Blood Glucose Level (mg/dL)' columns."
-            )
+            line, hypo, hyper, peaks = self._ts_artists
+            line.set_data(plot_x, plot_y)
+            line.set_marker(marker)
+            hypo.set_offsets(np.c_[mdates.date2num(datetimes[hypo_mask]), levels[hypo_mask]])
+            hyper.set_offsets(np.c_[mdates.date2num(datetimes[hyper_mask]), levels[hyper_mask]])
+            peaks.set_offsets(np.c_[mdates.date2num(datetimes[peak_idx]), levels[peak_idx]])
+
+            old_limits = (ax.get_xlim(), ax.get_ylim())
+            ax.relim()
+            ax.autoscale_view()
+            if (ax.get_xlim(), ax.get_ylim()) != old_limits:
+                self._ts_bg = None
+            self._blit_ts_artists()
+
+        self._ts_window.deiconify()
+        self._ts_window.lift()
+
+    def _init_ts_window(self):
+        """Creates the persistent window, figure and canvas for the time graph."""
+        from matplotlib import pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        _apply_style()
+
+        self._ts_window = ctk.CTkToplevel(self.app.root)
+        self._ts_window.title("Blood Glucose Graph")
+        self._ts_window.geometry("800x600")
+        self._ts_window.lift()
+        self._ts_window.config(bg=c.BG_COLOR)
+        # Closing only hides the window, so the canvas widget and figure
+        # survive and the next redraw skips the full rebuild.
+        self._ts_window.protocol("WM_DELETE_WINDOW", self._ts_window.withdraw)
+
+        self._ts_fig, self._ts_ax = plt.subplots(figsize=(12, 6), dpi=72)
+        self._ts_canvas = FigureCanvasTkAgg(self._ts_fig, self._ts_window)
+        self._ts_canvas.get_tk_widget().pack(fill="both", expand=True, pady=(5, 20))
+        self._ts_canvas.mpl_connect("resize_event", self._on_ts_resize)
+        self._ts_artists = None
+        self._ts_bg = None
+
+        save_button = ctk.CTkButton(self._ts_window, text="Save Graph",
+                                    command=lambda: self.app.save_graph(self._ts_fig))
+        save_button.pack(pady=10)
+
+    def _on_ts_resize(self, event):
+        """Invalidates the cached blit background when the canvas is resized."""
+        self._ts_bg = None
+
+    def _blit_ts_artists(self):
+        """Redraws only the data artists over the cached static background."""
+        canvas = self._ts_canvas
+        ax = self._ts_ax
+        if self._ts_bg is None:
+            for artist in self._ts_artists:
+                artist.set_visible(False)
+            canvas.draw()
+            self._ts_bg = canvas.copy_from_bbox(ax.bbox)
+            for artist in self._ts_artists:
+                artist.set_visible(True)
+        canvas.restore_region(self._ts_bg)
+        for artist in self._ts_artists:
+            ax.draw_artist(artist)
+        canvas.blit(ax.bbox)
 
     def make_graph_levels_meal(self, data_file):
         """
@@ -70,51 +319,93 @@ class GraphGenerator:
         Args:
             data_file (str): The path to the CSV file containing the data.
         """
-        data = pd.read_csv(data_file)
-        if {"Meal", "Blood Glucose Level (mg/dL)"}.issubset(data.columns):
-            unique_meals = data["Meal"].unique()
-            colors = list(mcolors.TABLEAU_COLORS.values())[:len(unique_meals)]
-            meal_colors = {meal: colors[i % len(colors)] for i, meal in enumerate(unique_meals)}
-
-            fig, ax = plt.subplots(figsize=(10, 5))
-            for meal in unique_meals:
-                meal_data = data[data["Meal"] == meal]
-                ax.bar(meal_data["Meal"], meal_data["Blood Glucose Level (mg/dL)"],
-                       color=meal_colors[meal], edgecolor="black", alpha=0.8, label=meal)
+        import matplotlib.colors as mcolors
+        import numpy as np
+        import pandas as pd
+        from matplotlib.patches import Patch
+
+        try:
+            data = _load_csv(data_file)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load dataset: {e}")
+            return
+        if _REQ_MEAL_COLS <= set(data.columns):
+            meals = pd.Categorical(data["Meal"])
+            palette = np.array(list(mcolors.TABLEAU_COLORS.values()))
+            bar_colors = palette[meals.codes % len(palette)]
+
+            ax = self._static_axes()
+            ax.bar(data["Meal"], data["Blood Glucose Level (mg/dL)"],
+                   color=bar_colors, edgecolor="black", alpha=0.8)
+            legend_handles = [
+                Patch(facecolor=palette[i % len(palette)], edgecolor="black", alpha=0.8, label=meal)
+                for i, meal in enumerate(meals.categories)
+            ]
 
             ax.set_title("Blood Glucose Levels by Meal", fontsize=20)
             ax.set_xlabel("Meal", fontsize=16)
             ax.set_ylabel("Blood Glucose Level (mg/dL)", fontsize=16)
             ax.tick_params(axis="x", rotation=45, labelsize=12)
             ax.tick_params(axis="y", labelsize=12)
-            ax.grid(alpha=0.7, linestyle="--")
-            ax.legend(title="Meals", fontsize=14, title_fontsize=14, loc='upper right', frameon=True, shadow=True, borderpad=1)
+            ax.legend(handles=legend_handles, title="Meals", fontsize=14, title_fontsize=14, loc='upper right', frameon=True, shadow=True, borderpad=1)
 
-            self.display_graph_window(fig)
+            self._show_static_graph()
         else:
             messagebox.showerror(
                 "Error", "Dataset must include 'Meal' and 'Blood Glucose Level (mg/dL)' columns."
             )
 
-    def display_graph_window(self, fig):
+    def _static_axes(self):
         """
-        Creates a new window to display the graph.
+        Returns the shared axes for one-shot graphs, clearing any previous plot.
 
-        Args:
-            fig (matplotlib.figure.Figure): The figure to display.
+        The window, figure and canvas are created once and reused, so showing
+        another graph only clears and refills the axes.
+
+        Returns:
+            Axes: The shared matplotlib axes.
         """
-        graph_window = ctk.CTkToplevel(self.app.root)
-        graph_window.title("Blood Glucose Graph")
-        graph_window.geometry("800x600")
-        graph_window.lift()
-        graph_window.config(bg=c.BG_COLOR)
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        _apply_style()
+        if self._static_window is None or not self._static_window.winfo_exists():
+            self._static_window = ctk.CTkToplevel(self.app.root)
+            self._static_window.title("Blood Glucose Graph")
+            self._static_window.geometry("800x600")
+            self._static_window.lift()
+            self._static_window.config(bg=c.BG_COLOR)
+            self._static_window.protocol("WM_DELETE_WINDOW", self._static_window.withdraw)
+
+            self._static_fig = Figure(figsize=(10, 6), dpi=72)
+            self._static_ax = self._static_fig.add_subplot()
+            self._static_canvas = FigureCanvasAgg(self._static_fig)
+            self._static_label = tk.Label(self._static_window, bg=c.BG_COLOR)
+            self._static_label.pack(fill="both", expand=True, pady=(5, 20))
+
+            save_button = ctk.CTkButton(self._static_window, text="Save Graph",
+                                        command=lambda: self.app.save_graph(self._static_fig))
+            save_button.pack(pady=10)
+        else:
+            self._static_ax.clear()
+        return self._static_ax
 
-        canvas = FigureCanvasTkAgg(fig, graph_window)
-        canvas.get_tk_widget().pack(fill="both", expand=True, pady=(5, 20))
-        canvas.draw()
+    def _show_static_graph(self):
+        """Renders the shared figure to an RGBA buffer and swaps it into the label.
 
-        save_button = ctk.CTkButton(graph_window, text="Save Graph", command=lambda: self.app.save_graph(fig))
-        save_button.pack(pady=10)
+        Static graphs are non-interactive, so one Agg render handed to a plain
+        Tk label avoids the FigureCanvasTkAgg widget machinery entirely.
+        """
+        import numpy as np
+
+        self._static_canvas.draw()
+        buf = np.asarray(self._static_canvas.buffer_rgba())
+        height, width = buf.shape[:2]
+        ppm = b"P6 %d %d 255\n" % (width, height) + buf[:, :, :3].tobytes()
+        self._static_photo = tk.PhotoImage(master=self._static_window, data=ppm)
+        self._static_label.configure(image=self._static_photo)
+        self._static_window.deiconify()
+        self._static_window.lift()
 
     def show_bmi_all_users(self, users, bmis):
         """
@@ -129,7 +420,7 @@ class GraphGenerator:
         max_bmi_user = users[bmis.index(max_bmi)]
         min_bmi_user = users[bmis.index(min_bmi)]
 
-        fig, ax = plt.subplots(figsize=(10, 6))
+        ax = self._static_axes()
         ax.plot(users, bmis, marker='o', color='#4682B4', label='BMI')
         ax.plot(max_bmi_user, max_bmi, marker='o', color='red', label='Highest BMI')
         ax.plot(min_bmi_user, min_bmi, marker='o', color='purple', label='Lowest BMI')
@@ -137,9 +428,8 @@ class GraphGenerator:
         ax.set_ylabel('BMI', fontsize=16)
         ax.set_title('BMI of All Users', fontsize=20)
         ax.legend()
-        fig.tight_layout()
 
-        self.display_graph_window(fig)
+        self._show_static_graph()
 
     def show_avg_bmi_by_type(self, avg_bmi_per_type):
         """
@@ -148,7 +438,7 @@ class GraphGenerator:
         Args:
             avg_bmi_per_type (dict): A dictionary where keys are diabetes types and values are average BMI values.
         """
-        fig, ax = plt.subplots(figsize=(10, 6))
+        ax = self._static_axes()
         colors = ['blue', 'orange', 'green', 'red', 'purple', 'brown', 'pink', 'gray', 'olive', 'cyan']
         for i, (dtype, avg_bmi) in enumerate(avg_bmi_per_type.items()):
             dtype_wrapped = dtype.replace(" ", "\n")
@@ -156,9 +446,8 @@ class GraphGenerator:
         ax.set_xlabel('Diabetes Type', fontsize=16)
         ax.set_ylabel('Average BMI', fontsize=16)
         ax.set_title('Average BMI for Each Diabetes Type', fontsize=20)
-        fig.tight_layout()
 
-        self.display_graph_window(fig)
+        self._show_static_graph()
 
     def show_age_distribution_by_type(self, age_data):
         """
@@ -170,8 +459,8 @@ class GraphGenerator:
         diabetes_types = list(age_data.keys())
         age_values = [age_data[dtype] for dtype in diabetes_types]
 
-        fig, ax = plt.subplots(figsize=(10, 6))
-        box = ax.boxplot(age_values, labels=diabetes_types, patch_artist=True)
+        ax = self._static_axes()
+        box = ax.boxplot(age_values, tick_labels=diabetes_types, patch_artist=True)
 
         colors = ['lightblue', 'lightgreen', 'lightcoral', 'lightskyblue', 'lightpink', 'lightyellow', 'lightgray',
                   'lightcyan', 'lightgoldenrodyellow', 'lightseagreen']
@@ -184,8 +473,7 @@ class GraphGenerator:
         ax.set_ylabel('Age', fontsize=18)
         ax.grid(axis='y', linestyle='--', alpha=0.7)
 
-        fig.tight_layout()
-        self.display_graph_window(fig)
+        self._show_static_graph()
 
     def show_gender_distribution_by_type(self, gender_data):
         """
@@ -194,17 +482,24 @@ class GraphGenerator:
         Args:
             gender_data (dict): A dictionary where keys are diabetes types and values are lists of genders.
         """
-        fig, ax = plt.subplots(figsize=(10, 6))
+        import numpy as np
+        import pandas as pd
+
+        ax = self._static_axes()
 
         diabetes_types = list(gender_data.keys())
-        gender_categories = sorted(set(gender for genders in gender_data.values() for gender in genders))
-        gender_counts = {dtype: pd.Series(genders).value_counts() for dtype, genders in gender_data.items()}
+        gender_categories = sorted(set().union(*gender_data.values()))
+        pairs = pd.DataFrame(
+            [(dtype, gender) for dtype, genders in gender_data.items() for gender in genders],
+            columns=['diabetes_type', 'gender'],
+        )
+        gender_counts = pairs.groupby(['diabetes_type', 'gender']).size()
 
         colors = ['lightpink', 'lightblue', 'mediumpurple']
         gender_colors = {gender: colors[i % len(colors)] for i, gender in enumerate(gender_categories)}
 
         for i, gender in enumerate(gender_categories):
-            counts = [gender_counts[dtype].get(gender, 0) for dtype in diabetes_types]
+            counts = [gender_counts.get((dtype, gender), 0) for dtype in diabetes_types]
             ax.bar(np.arange(len(diabetes_types)) + i * 0.2, counts, width=0.2, label=gender,
                    color=gender_colors[gender])
 
@@ -216,5 +511,4 @@ class GraphGenerator:
         ax.legend(title='Gender', fontsize=16, title_fontsize=16)
         ax.grid(axis='y', linestyle='--', alpha=0.7)
 
-        fig.tight_layout()
-        self.display_graph_window(fig)
\ No newline at end of file
+        self._show_static_graph()
\ No newline at end of file
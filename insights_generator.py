@@ -1,10 +1,95 @@
+import hashlib
+import os
+import tempfile
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import messagebox, filedialog
-import pandas as pd
 import customtkinter as ctk
-import csv
 from custom_threshold_dialog import CustomThresholdDialog
 import colors as c
 
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:  # numba is optional; pandas' groupby is used without it
+    _HAVE_NUMBA = False
+
+    def njit(**kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+_IO_POOL = ThreadPoolExecutor(max_workers=2)
+
+_CATEGORY_LABELS = ('Low', 'Normal', 'High')
+
+_CHUNK_SIZE = 100_000
+# Datasets larger than this are folded chunk-by-chunk instead of loaded whole.
+_STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+def _time_of_day(times):
+    """
+    Converts a Series of time-of-day values to timedeltas.
+
+    Handles HH:MM and HH:MM:SS strings as well as the datetime.time objects
+    the pyarrow read_csv engine produces.
+    """
+    import pandas as pd
+
+    try:
+        return pd.to_timedelta(times)
+    except (ValueError, TypeError):
+        pass
+    times = times.astype(str)
+    try:
+        return pd.to_timedelta(times)
+    except ValueError:
+        return pd.to_timedelta(times + ':00')
+
+
+@njit(cache=True)
+def _meal_agg_kernel(codes, vals, sums, sums_sq, mins, maxs, counts):
+    """One fused cache-friendly pass accumulating per-meal aggregates."""
+    for i in range(vals.shape[0]):
+        code = codes[i]
+        if code < 0:
+            continue
+        value = vals[i]
+        if value != value:  # NaN; groupby.agg skips these too
+            continue
+        sums[code] += value
+        sums_sq[code] += value * value
+        if value < mins[code]:
+            mins[code] = value
+        if value > maxs[code]:
+            maxs[code] = value
+        counts[code] += 1
+
+
+def _parse_dates(dates):
+    """
+    Parses the Date column with an explicit format detected from one sample.
+
+    Detecting the format once lets pandas take its C strptime fast path and
+    cache unique strings instead of inferring per row.
+    """
+    import pandas as pd
+
+    if dates.dtype != object:
+        return pd.to_datetime(dates, cache=True)
+    sample = dates.dropna()
+    first = sample.iloc[0] if not sample.empty else None
+    if not isinstance(first, str):
+        # e.g. datetime.date objects from the pyarrow read_csv engine
+        return pd.to_datetime(dates, cache=True)
+    from pandas.tseries.api import guess_datetime_format
+
+    fmt = guess_datetime_format(first)
+    try:
+        return pd.to_datetime(dates, format=fmt, cache=True)
+    except ValueError:
+        return pd.to_datetime(dates, cache=True)
+
 
 class InsightsGenerator:
     """
@@ -20,17 +105,23 @@ class InsightsGenerator:
         app (object): The main application instance.
     """
 
-    def __init__(self, app):
+    def __init__(self, app, engine="pandas"):
         """
         Initializes the InsightsGenerator.
 
         Args:
             app (object): The main application instance.
+            engine (str): The aggregation engine, "pandas" or "polars".
         """
         self.app = app
+        self.engine = engine
         self.data_file = None
+        self.data_df = None
         self.low_threshold = None
         self.high_threshold = None
+        self._insights_window = None
+        self._insights_cache_key = None
+        self._insights_cache = None
 
     def load_data(self):
         """
@@ -39,10 +130,18 @@ class InsightsGenerator:
         Returns:
             DataFrame: The loaded dataset as a pandas DataFrame, or None if no dataset is loaded.
         """
+        import pandas as pd
+
+        if self.data_df is not None:
+            return self.data_df.copy(deep=False)
         if self.data_file is None:
             messagebox.showerror("Error", "No dataset loaded. Please choose a file first.")
             return None
-        return pd.read_csv(self.data_file)
+        try:
+            return pd.read_csv(self.data_file)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load dataset: {e}")
+            return None
 
     def set_thresholds(self):
         """
@@ -51,12 +150,15 @@ class InsightsGenerator:
         Returns:
             bool: True if thresholds are set, False otherwise.
         """
-        if not self.low_threshold or not self.high_threshold:
-            threshold_dialog = CustomThresholdDialog(self.app.root, "Set Thresholds", low_initial=70, high_initial=180)
+        app = self.app
+        if app.low_threshold is None or app.high_threshold is None:
+            threshold_dialog = CustomThresholdDialog(app.root, "Set Thresholds", low_initial=70, high_initial=180)
             thresholds = threshold_dialog.show()
             if not thresholds:
                 return False
-            self.low_threshold, self.high_threshold = thresholds
+            app.low_threshold, app.high_threshold = thresholds
+            app.save_settings()
+        self.low_threshold, self.high_threshold = app.low_threshold, app.high_threshold
         return True
 
     def generate_meal_stats(self, data):
@@ -69,62 +171,344 @@ class InsightsGenerator:
         Returns:
             DataFrame: Meal statistics including mean, std, min, max, count, and range.
         """
-        meal_groups = data.groupby('Meal')['Blood Glucose Level (mg/dL)']
-        meal_stats = meal_groups.agg(['mean', 'std', 'min', 'max', 'count'])
-        meal_stats['range'] = meal_stats['max'] - meal_stats['min']
-        return meal_stats.round(2)
-
-    def categorize_data(self, data):
-        """
-        Categorizes the data based on blood glucose levels.
+        if _HAVE_NUMBA:
+            return self._meal_stats_numba(data)
+        meal_groups = data.groupby('Meal', sort=False, observed=True)['Blood Glucose Level (mg/dL)']
+        meal_stats = meal_groups.agg(mean='mean', std='std', min='min', max='max', count='count')
+        meal_stats['range'] = meal_stats['max'].to_numpy() - meal_stats['min'].to_numpy()
+        # rounding happens at the display/export edges, keeping this frame exact
+        return meal_stats
+
+    @staticmethod
+    def _meal_stats_numba(data):
+        """Computes the meal statistics with the jitted single-pass kernel."""
+        import numpy as np
+        import pandas as pd
+
+        meals = pd.Categorical(data['Meal'])
+        vals = data['Blood Glucose Level (mg/dL)'].to_numpy(np.float64)
+        n_groups = len(meals.categories)
+        sums = np.zeros(n_groups)
+        sums_sq = np.zeros(n_groups)
+        mins = np.full(n_groups, np.inf)
+        maxs = np.full(n_groups, -np.inf)
+        counts = np.zeros(n_groups, np.int64)
+        _meal_agg_kernel(meals.codes.astype(np.int64), vals, sums, sums_sq, mins, maxs, counts)
+
+        seen = counts > 0
+        counts = counts[seen]
+        mean = sums[seen] / counts
+        variance = (sums_sq[seen] - counts * mean * mean) / np.where(counts > 1, counts - 1, np.nan)
+        meal_stats = pd.DataFrame({
+            'mean': mean,
+            'std': np.sqrt(variance.clip(min=0)),
+            'min': mins[seen],
+            'max': maxs[seen],
+            'count': counts,
+            'range': maxs[seen] - mins[seen],
+        }, index=meals.categories[seen])
+        meal_stats.index.name = 'Meal'
+        # match the pandas path's sort=False ordering (first appearance)
+        return meal_stats.reindex(data['Meal'].dropna().unique())
+
+    def generate_category_counts(self, levels):
+        """
+        Computes the share of readings in the Low/Normal/High glucose bands.
+
+        Two branchless vectorized comparisons fold straight into int8 labels,
+        so no per-row label column or Categorical is materialized.
 
         Args:
-            data (DataFrame): The dataset as a pandas DataFrame.
+            levels (ndarray): The glucose values.
 
         Returns:
-            DataFrame: The dataset with an additional 'Category' column.
+            Series: The percentage of readings per category.
         """
-        data['Category'] = pd.cut(data['Blood Glucose Level (mg/dL)'],
-                                  bins=[0, self.low_threshold, self.high_threshold, float('inf')],
-                                  labels=['Low', 'Normal', 'High'])
-        return data
+        import numpy as np
+        import pandas as pd
 
-    def generate_daily_averages(self, data):
+        if levels.dtype.kind == 'f':
+            levels = levels[~np.isnan(levels)]  # pd.cut excluded NaN too
+        if levels.size == 0:
+            return pd.Series(0.0, index=list(_CATEGORY_LABELS))
+        label_idx = ((levels >= self.low_threshold).astype(np.int8)
+                     + (levels > self.high_threshold).astype(np.int8))
+        counts = np.bincount(label_idx, minlength=3).astype(np.float64)
+        return pd.Series(counts / counts.sum() * 100, index=list(_CATEGORY_LABELS))
+
+    def generate_daily_averages(self, data, dt):
         """
         Generates daily averages of blood glucose levels.
 
         Args:
             data (DataFrame): The dataset as a pandas DataFrame.
+            dt (Series): The parsed per-row timestamps.
 
         Returns:
             Series: Daily averages of blood glucose levels.
         """
-        data['Datetime'] = pd.to_datetime(data['Date'] + ' ' + data['Time'])
-        data.set_index('Datetime', inplace=True)
-        return data['Blood Glucose Level (mg/dL)'].resample('D').mean()
+        import pandas as pd
+
+        if 'Datetime' in data.columns:
+            # Grouper works on the plain RangeIndex, no sorted DatetimeIndex
+            # has to be materialized the way resample required
+            daily = data.groupby(pd.Grouper(key='Datetime', freq='D'))['Blood Glucose Level (mg/dL)'].mean()
+            return daily.dropna()
+        return data['Blood Glucose Level (mg/dL)'].groupby(dt.dt.normalize()).mean()
 
-    def generate_time_period_averages(self, data):
+    def generate_time_period_averages(self, values, hours):
         """
         Generates averages for different time periods of the day.
 
+        Works directly on the glucose ndarray with weighted bincounts, below
+        pandas' per-op alignment overhead.
+
         Args:
-            data (DataFrame): The dataset as a pandas DataFrame.
+            values (ndarray): The glucose values.
+            hours (ndarray): The per-row hour of day.
 
         Returns:
             dict: Averages of blood glucose levels for different time periods.
         """
-        time_periods = {
-            'Morning': ('06:00', '09:00'),
-            'Noon': ('09:00', '12:00'),
-            'Afternoon': ('12:00', '18:00'),
-            'Evening': ('18:00', '21:00'),
-            'Night': ('21:00', '06:00')
-        }
-        averages = {}
-        for period, (start, end) in time_periods.items():
-            period_data = data.between_time(start, end)
-            averages[period] = period_data['Blood Glucose Level (mg/dL)'].mean()
-        return averages
+        import numpy as np
+
+        if values.dtype.kind == 'f':
+            finite = ~np.isnan(values)  # between_time(...).mean() skipped NaN too
+            values = values[finite]
+            hours = hours[finite]
+        period_names = ['Morning', 'Noon', 'Afternoon', 'Evening', 'Night']
+        codes = np.digitize(hours, [6, 9, 12, 18, 21])
+        codes = np.where(codes == 0, 5, codes)  # hours before 06:00 wrap into Night
+        sums = np.bincount(codes, weights=values, minlength=6)
+        counts = np.bincount(codes, minlength=6)
+        return {period: (sums[code] / counts[code] if counts[code] else None)
+                for code, period in enumerate(period_names, start=1)}
+
+    def _use_streaming(self):
+        """Returns True when the dataset should be aggregated chunk by chunk."""
+        return (self.data_df is None and self.data_file is not None
+                and os.path.getsize(self.data_file) > _STREAM_THRESHOLD_BYTES)
+
+    @staticmethod
+    def _merge_meal_chunks(acc, stats):
+        """
+        Merges per-meal (count, mean, m2, min, max) accumulators.
+
+        Uses Chan's parallel variance formula, which stays numerically stable
+        where a naive sum/sum-of-squares accumulator loses precision.
+        """
+        import pandas as pd
+
+        idx = acc.index.union(stats.index)
+        a = acc.reindex(idx)
+        b = stats.reindex(idx)
+        count_a = a['count'].fillna(0)
+        count_b = b['count'].fillna(0)
+        mean_a = a['mean'].fillna(0.0)
+        mean_b = b['mean'].fillna(0.0)
+        count = count_a + count_b
+        delta = mean_b - mean_a
+        merged = pd.DataFrame(index=idx)
+        merged['count'] = count
+        merged['mean'] = mean_a + delta * count_b / count
+        merged['m2'] = (a['m2'].fillna(0.0) + b['m2'].fillna(0.0)
+                        + delta ** 2 * count_a * count_b / count)
+        merged['min'] = pd.concat([a['min'], b['min']], axis=1).min(axis=1)
+        merged['max'] = pd.concat([a['max'], b['max']], axis=1).max(axis=1)
+        return merged
+
+    def _aggregate_with_polars(self):
+        """
+        Computes the insight aggregates with Polars' parallel Rust engine.
+
+        Only the small result frames are converted back to pandas for the
+        display layer.
+
+        Returns:
+            tuple or None: The aggregates, or None when polars is unavailable
+            or the dataset cannot be processed with it.
+        """
+        import pandas as pd
+
+        try:
+            import polars as pl
+
+            col = 'Blood Glucose Level (mg/dL)'
+            glucose = pl.col(col)
+            df = pl.read_csv(self.data_file)
+            # parse the two columns separately and combine natively, instead
+            # of materializing a concatenated string column first
+            df = df.with_columns(
+                pl.col('Date').str.to_date(strict=False)
+                .dt.combine(pl.col('Time').str.to_time(strict=False)).alias('Datetime'))
+
+            meal_stats = (df.group_by('Meal')
+                          .agg(glucose.mean().alias('mean'), glucose.std().alias('std'),
+                               glucose.min().alias('min'), glucose.max().alias('max'),
+                               glucose.count().alias('count'),
+                               (glucose.max() - glucose.min()).alias('range'))
+                          .sort('Meal')
+                          .to_pandas().set_index('Meal').round(2))
+
+            totals = df.select((glucose < self.low_threshold).sum().alias('low'),
+                               (glucose > self.high_threshold).sum().alias('high'),
+                               glucose.count().alias('n')).row(0)
+            low, high, n = totals
+            category_counts = pd.Series([low, n - low - high, high],
+                                        index=list(_CATEGORY_LABELS), dtype=float) / n * 100
+
+            daily = (df.group_by(pl.col('Datetime').dt.date().alias('day'))
+                     .agg(glucose.mean().alias('average')).sort('day').to_pandas())
+            daily_avg = daily.set_index('day')['average']
+            daily_avg.index = pd.to_datetime(daily_avg.index)
+
+            hours = pl.col('Datetime').dt.hour()
+            period = (pl.when(hours.is_between(6, 8)).then(pl.lit('Morning'))
+                      .when(hours.is_between(9, 11)).then(pl.lit('Noon'))
+                      .when(hours.is_between(12, 17)).then(pl.lit('Afternoon'))
+                      .when(hours.is_between(18, 20)).then(pl.lit('Evening'))
+                      .otherwise(pl.lit('Night')))
+            period_means = dict(df.group_by(period.alias('period'))
+                                .agg(glucose.mean().alias('avg')).iter_rows())
+            time_period_averages = {p: period_means.get(p)
+                                    for p in ('Morning', 'Noon', 'Afternoon', 'Evening', 'Night')}
+
+            extremes = pl.concat([df.top_k(5, by=col), df.bottom_k(5, by=col)]).to_pandas()
+            return meal_stats, category_counts, daily_avg, time_period_averages, extremes
+        except Exception:
+            # the polars engine is opportunistic; fall back to pandas on any failure
+            return None
+
+    def _aggregate_cache_key(self):
+        """Builds the sidecar cache key for the current file and thresholds."""
+        stat = os.stat(self.data_file)
+        raw = str((self.data_file, stat.st_mtime, stat.st_size,
+                   self.low_threshold, self.high_threshold))
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+    def _load_cached_aggregates(self):
+        """
+        Loads previously computed aggregates from the parquet sidecar cache.
+
+        Returns:
+            tuple: The cached aggregates, or None on any miss or read failure.
+        """
+        import pandas as pd
+
+        try:
+            base = os.path.join(tempfile.gettempdir(), 'blood_glucose_insights',
+                                self._aggregate_cache_key())
+            meal_stats = pd.read_parquet(base + '-meals.parquet')
+            category_counts = pd.read_parquet(base + '-categories.parquet')['percentage']
+            daily_avg = pd.read_parquet(base + '-daily.parquet')['average']
+            periods = pd.read_parquet(base + '-periods.parquet')['average']
+            extremes = pd.read_parquet(base + '-extremes.parquet')
+            time_period_averages = {k: (None if pd.isna(v) else v) for k, v in periods.items()}
+            return meal_stats, category_counts, daily_avg, time_period_averages, extremes
+        except Exception:
+            return None
+
+    def _store_cached_aggregates(self, meal_stats, category_counts, daily_avg,
+                                 time_period_averages, extremes):
+        """Writes the aggregates to the parquet sidecar cache; failures are ignored."""
+        import pandas as pd
+
+        try:
+            cache_dir = os.path.join(tempfile.gettempdir(), 'blood_glucose_insights')
+            os.makedirs(cache_dir, exist_ok=True)
+            base = os.path.join(cache_dir, self._aggregate_cache_key())
+            meal_stats.to_parquet(base + '-meals.parquet')
+            category_counts.rename('percentage').to_frame().to_parquet(base + '-categories.parquet')
+            daily_avg.rename('average').to_frame().to_parquet(base + '-daily.parquet')
+            pd.Series(time_period_averages, name='average', dtype=float).to_frame().to_parquet(base + '-periods.parquet')
+            extremes.to_parquet(base + '-extremes.parquet')
+        except Exception:
+            pass  # the cache is best-effort; pyarrow may be missing
+
+    def _aggregate_streaming(self, top_n=5):
+        """
+        Folds the CSV into the insight aggregates one chunk at a time.
+
+        Memory stays proportional to the chunk size instead of the file, so
+        datasets far larger than RAM still produce insights.
+
+        Args:
+            top_n (int): The number of extreme rows to keep per end.
+
+        Returns:
+            tuple: (meal_stats, category_counts, daily_avg, time_period_averages, extremes)
+        """
+        import numpy as np
+        import pandas as pd
+
+        col = 'Blood Glucose Level (mg/dL)'
+        hour_edges = np.array([6, 9, 12, 18, 21])
+        meal_acc = None
+        daily_acc = None
+        cat_counts = np.zeros(3, dtype=np.int64)
+        period_sums = np.zeros(6)
+        period_counts = np.zeros(6, dtype=np.int64)
+        tops = []
+        bottoms = []
+
+        reader = pd.read_csv(self.data_file, chunksize=_CHUNK_SIZE,
+                             dtype={col: 'float32', 'Meal': 'category'})
+        for chunk in reader:
+            vals = chunk[col]
+            raw = vals.to_numpy()
+
+            stats = chunk.groupby('Meal', observed=True)[col].agg(['count', 'mean', 'var', 'min', 'max'])
+            stats['m2'] = (stats['var'] * (stats['count'] - 1)).fillna(0.0)
+            stats = stats.drop(columns='var')
+            meal_acc = stats if meal_acc is None else self._merge_meal_chunks(meal_acc, stats)
+
+            finite_mask = ~np.isnan(raw) if raw.dtype.kind == 'f' else np.ones(raw.size, bool)
+            finite = raw[finite_mask]
+            labels = ((finite >= self.low_threshold).astype(np.int8)
+                      + (finite > self.high_threshold).astype(np.int8))
+            cat_counts += np.bincount(labels, minlength=3)
+
+            dt = pd.to_datetime(chunk['Date'], cache=True) + _time_of_day(chunk['Time'])
+            days = vals.groupby(dt.dt.normalize()).agg(['sum', 'count'])
+            daily_acc = days if daily_acc is None else daily_acc.add(days, fill_value=0)
+
+            codes = np.searchsorted(hour_edges, dt.dt.hour.to_numpy()[finite_mask], side='right')
+            period_sums += np.bincount(codes, weights=finite, minlength=6)
+            period_counts += np.bincount(codes, minlength=6)
+
+            tops.append(chunk.nlargest(top_n, col))
+            bottoms.append(chunk.nsmallest(top_n, col))
+
+        counts = meal_acc['count']
+        variance = meal_acc['m2'] / (counts - 1).where(counts > 1)
+        meal_stats = pd.DataFrame({
+            'mean': meal_acc['mean'],
+            'std': np.sqrt(variance.clip(lower=0)),
+            'min': meal_acc['min'],
+            'max': meal_acc['max'],
+            'count': counts.astype(int),
+        })
+        meal_stats['range'] = meal_stats['max'] - meal_stats['min']
+        meal_stats = meal_stats.round(2)
+        meal_stats.index.name = 'Meal'
+
+        total = cat_counts.sum()
+        category_counts = pd.Series(cat_counts / total * 100 if total else cat_counts,
+                                    index=list(_CATEGORY_LABELS), dtype=float)
+
+        daily_avg = daily_acc['sum'] / daily_acc['count']
+
+        # codes 0 and 5 are both night (before 06:00 and from 21:00)
+        night_sum = period_sums[0] + period_sums[5]
+        night_count = period_counts[0] + period_counts[5]
+        time_period_averages = {}
+        for code, period in ((1, 'Morning'), (2, 'Noon'), (3, 'Afternoon'), (4, 'Evening')):
+            count = period_counts[code]
+            time_period_averages[period] = period_sums[code] / count if count else None
+        time_period_averages['Night'] = night_sum / night_count if night_count else None
+
+        extremes = pd.concat(tops + bottoms, ignore_index=True)
+        return meal_stats, category_counts, daily_avg, time_period_averages, extremes
 
     def show_insights(self):
         """
@@ -140,8 +524,17 @@ class InsightsGenerator:
         Raises:
             tkinter.TclError: If the dataset does not have the required columns.
         """
-        data = self.load_data()
-        if data is None or 'Meal' not in data.columns or 'Blood Glucose Level (mg/dL)' not in data.columns or 'Notes' not in data.columns:
+        import pandas as pd
+
+        if self._use_streaming():
+            data = None
+            columns = pd.read_csv(self.data_file, nrows=0).columns
+        else:
+            data = self.load_data()
+            if data is None:
+                return
+            columns = data.columns
+        if not {'Meal', 'Blood Glucose Level (mg/dL)', 'Notes'} <= set(columns):
             messagebox.showerror("Error",
                                  "The dataset does not have the required columns ('Meal', 'Blood Glucose Level (mg/dL)', 'Notes').")
             return
@@ -149,16 +542,92 @@ class InsightsGenerator:
         if not self.set_thresholds():
             return
 
-        meal_stats = self.generate_meal_stats(data)
-        data = self.categorize_data(data)
-        category_counts = data['Category'].value_counts(normalize=True) * 100
-        daily_avg = self.generate_daily_averages(data)
-        time_period_averages = self.generate_time_period_averages(data)
+        key = self._insights_key()
+        if key is not None and key == self._insights_cache_key:
+            if self._insights_window is not None and self._insights_window.winfo_exists():
+                self._insights_window.deiconify()
+                self._insights_window.lift()
+                return
+            if self._insights_cache is not None:
+                self._render_insights(self._insights_cache)
+                return
+
+        # pandas releases the GIL in its numeric kernels, so the aggregation
+        # runs concurrently with the Tk event loop; only rendering happens here
+        future = _IO_POOL.submit(self._compute_insights, data)
+        future.add_done_callback(lambda f: self._on_insights_ready(f, key))
+
+    def _insights_key(self):
+        """Builds the memoization key for the current file and thresholds."""
+        if self.data_file is None:
+            return None
+        try:
+            mtime = os.path.getmtime(self.data_file)
+        except OSError:
+            return None
+        return (self.data_file, self.low_threshold, self.high_threshold, mtime)
+
+    def _on_insights_ready(self, future, key):
+        """Marshals finished aggregates (or the failure) back to the Tk thread."""
+        try:
+            results = future.result()
+        except Exception as exc:
+            self.app.root.after(0, messagebox.showerror, "Error", f"Failed to compute insights: {exc}")
+            return
+        self._insights_cache_key = key
+        self._insights_cache = results
+        self.app.root.after(0, self._render_insights, results)
+
+    def _compute_insights(self, data):
+        """
+        Computes every insight aggregate; safe to run off the Tk thread.
 
-        insights_window = ctk.CTkToplevel(self.app.root)
-        insights_window.title("Blood Glucose Insights")
-        insights_window.attributes('-topmost', True)
-        insights_window.geometry("550x500")
+        Args:
+            data (DataFrame): The loaded dataset, or None to stream from disk.
+
+        Returns:
+            tuple: (meal_stats, category_counts, daily_avg, time_period_averages, extremes)
+        """
+        if data is None:
+            cached = self._load_cached_aggregates()
+            if cached is not None:
+                return cached
+            results = self._aggregate_streaming()
+            self._store_cached_aggregates(*results)
+            return results
+
+        results = self._aggregate_with_polars() if self.engine == "polars" else None
+        if results is not None:
+            return results
+
+        # one ndarray extraction feeds every vectorized aggregation below
+        values = data['Blood Glucose Level (mg/dL)'].to_numpy()
+        meal_stats = self.generate_meal_stats(data)
+        category_counts = self.generate_category_counts(values)
+        if 'Datetime' in data.columns:
+            dt = data['Datetime']
+        else:
+            dt = _parse_dates(data['Date']) + _time_of_day(data['Time'])
+        daily_avg = self.generate_daily_averages(data, dt)
+        time_period_averages = self.generate_time_period_averages(values, dt.dt.hour.to_numpy())
+        return meal_stats, category_counts, daily_avg, time_period_averages, data
+
+    def _render_insights(self, results):
+        """Builds the insights window from precomputed aggregates on the Tk thread."""
+        meal_stats, category_counts, daily_avg, time_period_averages, extremes = results
+
+        if self._insights_window is not None and self._insights_window.winfo_exists():
+            insights_window = self._insights_window
+            for child in insights_window.winfo_children():
+                child.destroy()
+            insights_window.deiconify()
+            insights_window.lift()
+        else:
+            insights_window = ctk.CTkToplevel(self.app.root)
+            insights_window.title("Blood Glucose Insights")
+            insights_window.attributes('-topmost', True)
+            insights_window.geometry("550x500")
+            self._insights_window = insights_window
 
         insights_frame = ctk.CTkScrollableFrame(insights_window, fg_color="#FFFFFF", width=550, height=400)
         insights_frame.pack(pady=10, padx=10)
@@ -167,12 +636,38 @@ class InsightsGenerator:
         self.display_category_counts(insights_frame, category_counts)
         self.display_daily_averages(insights_frame, daily_avg)
         self.display_time_period_averages(insights_frame, time_period_averages)
-        self.display_extreme_values(insights_frame, data)
+        self.display_extreme_values(insights_frame, extremes)
 
         ctk.CTkButton(insights_window, text="Export to CSV",
                       command=lambda: self.export_insights(meal_stats, category_counts, daily_avg,
                                                            time_period_averages)).pack(pady=10)
 
+    def _emit_batched(self, items, render_one, batch=50, on_done=None):
+        """
+        Renders rows in small batches through after_idle.
+
+        Tk gets a chance to paint between batches, so the window appears
+        immediately while long listings stream in.
+
+        Args:
+            items (iterator): The remaining rows.
+            render_one (callable): Renders a single row.
+            batch (int): Rows rendered per event-loop pass.
+            on_done (callable, optional): Runs once every row is rendered.
+        """
+        for _ in range(batch):
+            try:
+                item = next(items)
+            except StopIteration:
+                if on_done is not None:
+                    on_done()
+                return
+            try:
+                render_one(item)
+            except tk.TclError:
+                return  # the target widget was destroyed by a re-render
+        self.app.root.after_idle(self._emit_batched, items, render_one, batch, on_done)
+
     def display_meal_stats(self, frame, meal_stats):
         """
         Displays the meal statistics in a collapsible frame.
@@ -186,16 +681,19 @@ class InsightsGenerator:
         collapsible_frame.pack(pady=15, fill="x")
 
         meal_stats_container = self.create_background_frame(collapsible_frame.content_frame)
-        meal_stats_frame = ctk.CTkFrame(meal_stats_container, fg_color="#F9F9F9")
-        meal_stats_frame.pack(padx=10, pady=5, fill="x", expand=True)
         headers = ['Meal', 'Mean', 'Std Dev', 'Min', 'Max', 'Count', 'Range']
-        for col, header in enumerate(headers):
-            ctk.CTkLabel(meal_stats_frame, text=header, font=("Arial", 12, "bold")).grid(row=0, column=col, padx=10,
-                                                                                         sticky="ew")
-        for i, (meal, stats) in enumerate(meal_stats.iterrows(), 1):
-            ctk.CTkLabel(meal_stats_frame, text=meal).grid(row=i, column=0, padx=10, sticky="ew")
-            for col, value in enumerate(stats):
-                ctk.CTkLabel(meal_stats_frame, text=value).grid(row=i, column=col + 1, padx=10, sticky="ew")
+        # the whole table goes into one textbox as pre-joined rows, so the
+        # widget count stays constant no matter how many meals there are
+        values = meal_stats.round(2).to_numpy()
+        meals = meal_stats.index.to_numpy()
+        lines = ["\t".join(headers)]
+        for meal, row in zip(meals, values):
+            lines.append(str(meal) + "\t" + "\t".join(f"{value:g}" for value in row))
+        textbox = ctk.CTkTextbox(meal_stats_container, fg_color="#F9F9F9", wrap="none",
+                                 height=min(len(lines), 9) * 22)
+        textbox.insert("1.0", "\n".join(lines))
+        textbox.configure(state="disabled")
+        textbox.pack(padx=10, pady=5, fill="x")
 
     def display_category_counts(self, frame, category_counts):
         """
@@ -229,10 +727,15 @@ class InsightsGenerator:
         collapsible_frame.pack(pady=15, fill="x")
 
         daily_avg_container = self.create_background_frame(collapsible_frame.content_frame)
-        daily_avg_frame = ctk.CTkScrollableFrame(daily_avg_container, fg_color="#F9F9F9", width=500, height=200)
-        daily_avg_frame.pack(pady=10)
-        for date, avg in daily_avg.items():
-            ctk.CTkLabel(daily_avg_frame, text=f"{date.date()}: {avg:.2f} mg/dL", font=("Arial", 12)).pack(pady=2)
+        # a single text widget handles thousands of lines cheaply, where one
+        # label (or tree row) per day pays Tk geometry costs per widget
+        textbox = ctk.CTkTextbox(daily_avg_container, fg_color="#F9F9F9", width=500, height=200, wrap="none")
+        self._emit_batched(
+            iter(daily_avg.items()),
+            lambda item: textbox.insert("end", f"{item[0].date()}\t{item[1]:.2f} mg/dL\n"),
+            batch=200,
+            on_done=lambda: textbox.configure(state="disabled"))
+        textbox.pack(pady=10)
 
     def display_time_period_averages(self, frame, time_period_averages):
         """
@@ -264,25 +767,48 @@ class InsightsGenerator:
             data (DataFrame): The dataset as a pandas DataFrame.
             top_n (int): The number of highest and lowest values to display. Default is 5.
         """
+        import numpy as np
+
+        # argpartition would rank NaN as the largest value; nlargest dropped it
+        data = data[data['Blood Glucose Level (mg/dL)'].notna()]
+        levels = data['Blood Glucose Level (mg/dL)'].to_numpy()
+        if levels.size == 0:
+            return
+        top_n = min(top_n, levels.size)
+        # argpartition selects the k extremes in O(n); only those k get sorted
+        top_idx = np.argpartition(levels, -top_n)[-top_n:]
+        highest_values = data.iloc[top_idx[np.argsort(-levels[top_idx])]]
+        low_idx = np.argpartition(levels, top_n - 1)[:top_n]
+        lowest_values = data.iloc[low_idx[np.argsort(levels[low_idx])]]
+
         collapsible_frame_high = CollapsibleFrame(frame, title="Highest Blood Sugar Levels")
         collapsible_frame_high.pack(pady=15, fill="x")
 
         highest_values_container = self.create_background_frame(collapsible_frame_high.content_frame)
-        highest_values = data.nlargest(top_n, 'Blood Glucose Level (mg/dL)')
-        for _, row in highest_values.iterrows():
-            ctk.CTkLabel(highest_values_container,
-                         text=f"{row['Date']} {row['Time']}: {row['Blood Glucose Level (mg/dL)']} mg/dL - {row['Notes']}",
-                         font=("Arial", 12)).pack(pady=2)
+        for text in self._extreme_row_texts(highest_values):
+            ctk.CTkLabel(highest_values_container, text=text, font=("Arial", 12)).pack(pady=2)
 
         collapsible_frame_low = CollapsibleFrame(frame, title="Lowest Blood Sugar Levels")
         collapsible_frame_low.pack(pady=15, fill="x")
 
         lowest_values_container = self.create_background_frame(collapsible_frame_low.content_frame)
-        lowest_values = data.nsmallest(top_n, 'Blood Glucose Level (mg/dL)')
-        for _, row in lowest_values.iterrows():
-            ctk.CTkLabel(lowest_values_container,
-                         text=f"{row['Date']} {row['Time']}: {row['Blood Glucose Level (mg/dL)']} mg/dL - {row['Notes']}",
-                         font=("Arial", 12)).pack(pady=2)
+        for text in self._extreme_row_texts(lowest_values):
+            ctk.CTkLabel(lowest_values_container, text=text, font=("Arial", 12)).pack(pady=2)
+
+    @staticmethod
+    def _extreme_row_texts(values):
+        """
+        Builds the display strings for extreme readings in one vectorized pass.
+
+        Args:
+            values (DataFrame): The selected extreme rows.
+
+        Returns:
+            ndarray: One finished label string per row.
+        """
+        return (values['Date'].astype(str) + ' ' + values['Time'].astype(str) + ': '
+                + values['Blood Glucose Level (mg/dL)'].astype(str) + ' mg/dL - '
+                + values['Notes'].fillna('').astype(str)).to_numpy()
 
 
     def export_insights(self, meal_stats, category_counts, daily_avg, time_period_averages):
@@ -295,28 +821,28 @@ class InsightsGenerator:
             daily_avg (Series): The daily averages to export.
             time_period_averages (dict): The time period averages to export.
         """
-        export_path = filedialog.asksaveasfile(mode="w", defaultextension=".csv", filetypes=[("CSV Files", "*.csv")], parent=self.app.root)
-        if export_path:
-            export_data = [["Meal Statistics"], ['Meal', 'Mean', 'Std Dev', 'Min', 'Max', 'Count', 'Range']]
-            for meal, stats in meal_stats.iterrows():
-                export_data.append([meal, stats['mean'], stats['std'], stats['min'], stats['max'], stats['count'], stats['range']])
-            export_data.append([])
-            export_data.append(["Time in Range"])
-            export_data.append(['Category', 'Percentage (%)'])
-            for category, percentage in category_counts.items():
-                export_data.append([category, round(percentage, 2)])
-            export_data.append([])
-            export_data.append(["Daily Averages"])
-            export_data.append(['Date', 'Average Glucose (mg/dL)'])
-            for date, avg in daily_avg.items():
-                export_data.append([date.date(), round(avg, 2)])
-            export_data.append([])
-            for period, avg in time_period_averages.items():
-                export_data.append([f"{period} Average", round(avg, 2)])
-            with open(export_path.name, mode="w", newline="") as file:
-                writer = csv.writer(file)
-                writer.writerows(export_data)
-            messagebox.showinfo("Export Successful", f"Insights exported to {export_path.name}.")
+        import pandas as pd
+
+        export_path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV Files", "*.csv")], parent=self.app.root)
+        if not export_path:
+            return
+        # each section is written by pandas' C csv writer; no Python-level
+        # per-row boxing and only one open file handle
+        with open(export_path, mode="w", newline="", buffering=1 << 20) as file:
+            file.write("Meal Statistics\n")
+            meal_stats[['mean', 'std', 'min', 'max', 'count', 'range']].round(2).to_csv(
+                file, header=['Mean', 'Std Dev', 'Min', 'Max', 'Count', 'Range'], index_label='Meal')
+            file.write("\nTime in Range\n")
+            category_counts.round(2).to_csv(file, header=['Percentage (%)'], index_label='Category')
+            file.write("\nDaily Averages\n")
+            daily_dates = daily_avg.copy()
+            daily_dates.index = daily_dates.index.date
+            daily_dates.round(2).to_csv(file, header=['Average Glucose (mg/dL)'], index_label='Date')
+            file.write("\n")
+            periods = pd.Series(time_period_averages, dtype=float).round(2)
+            periods.index += ' Average'
+            periods.to_csv(file, header=False)
+        messagebox.showinfo("Export Successful", f"Insights exported to {export_path}.")
 
     def create_background_frame(self, parent):
         """